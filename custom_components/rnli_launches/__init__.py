@@ -1,10 +1,14 @@
 """The RNLI Launches integration."""
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
+from .const import CONF_STATION, DOMAIN
 from .coordinator import RNLIUpdateCoordinator
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
@@ -12,10 +16,36 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 type RNLIConfigEntry = ConfigEntry[RNLIUpdateCoordinator]
 
 
+async def _async_get_coordinator(hass: HomeAssistant) -> RNLIUpdateCoordinator:
+    """Return the coordinator shared by all stations, creating it if needed.
+
+    The launches feed is national, so one fetch per interval serves every
+    configured station.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    lock: asyncio.Lock = domain_data.setdefault("lock", asyncio.Lock())
+    async with lock:
+        coordinator: RNLIUpdateCoordinator | None = domain_data.get("coordinator")
+        if coordinator is None:
+            coordinator = RNLIUpdateCoordinator(hass)
+            domain_data["coordinator"] = coordinator
+        if coordinator.data is None or not coordinator.last_update_success:
+            await coordinator.async_refresh()
+            if not coordinator.last_update_success:
+                raise ConfigEntryNotReady(
+                    "Error fetching data from RNLI API"
+                ) from coordinator.last_exception
+    return coordinator
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: RNLIConfigEntry) -> bool:
     """Set up RNLI Launches from a config entry."""
-    coordinator = RNLIUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = await _async_get_coordinator(hass)
+    # Loaded entries, mapped to their station's slug for entity unique IDs
+    station = entry.data[CONF_STATION]
+    hass.data[DOMAIN].setdefault("entries", {})[entry.entry_id] = (
+        station.lower().replace(" ", "_")
+    )
 
     entry.runtime_data = coordinator
 
@@ -25,4 +55,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: RNLIConfigEntry) -> bool
 
 async def async_unload_entry(hass: HomeAssistant, entry: RNLIConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    domain_data = hass.data[DOMAIN]
+    entries: dict[str, str] = domain_data["entries"]
+    entries.pop(entry.entry_id, None)
+    if not entries:
+        # Last station gone; stop polling until a station is added again.
+        coordinator: RNLIUpdateCoordinator = domain_data.pop("coordinator")
+        await coordinator.async_shutdown()
+    return True
@@ -1,8 +1,9 @@
 """Config flow for RNLI Launches integration."""
 from __future__ import annotations
 
-import asyncio
+from dataclasses import dataclass
 import logging
+import time
 from typing import Any
 
 import aiohttp
@@ -11,6 +12,7 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import location as location_util
+from homeassistant.util.json import json_loads
 from homeassistant.helpers.selector import (
     SelectOptionDict,
     SelectSelector,
@@ -24,6 +26,7 @@ from .const import (
     MAX_SHOUTS,
     REQUEST_TIMEOUT,
     RNLI_API_URL,
+    STATION_CACHE_TTL,
     normalize_station,
 )
 from .stations import STATIONS
@@ -31,6 +34,18 @@ from .stations import STATIONS
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class _StationCache:
+    """Station names seen in the feed, shared by flows for a few minutes."""
+
+    fetched_at: float
+    # shortName -> title, as reported by the recent-launches feed
+    stations: dict[str, str]
+    # The dropdown schema built from these stations by the first flow to
+    # use them, so later flows can skip rebuilding it.
+    schema: vol.Schema | None = None
+
+
 class RNLIConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for RNLI Launches."""
 
@@ -50,27 +65,50 @@ class RNLIConfigFlow(ConfigFlow, domain=DOMAIN):
             }
             for name, info in STATIONS.items()
         }
+        self._schema: vol.Schema | None = None
+
+    async def _async_fetch_live_stations(self) -> _StationCache:
+        """Return the stations in the recent-launches feed.
+
+        The result is cached at domain level for a few minutes, so adding
+        several stations in a row only downloads the feed once.
+        """
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        cached: _StationCache | None = domain_data.get("_station_cache")
+        if (
+            cached is not None
+            and time.monotonic() - cached.fetched_at < STATION_CACHE_TTL
+        ):
+            return cached
 
-    async def _async_overlay_live_stations(self) -> None:
-        """Overlay station names seen in the recent-launches feed."""
         session = async_get_clientsession(self.hass)
-        async with asyncio.timeout(REQUEST_TIMEOUT):
-            response = await session.get(
-                RNLI_API_URL,
-                headers={"Accept": "application/json"},
-                params={"numberOfShouts": MAX_SHOUTS},
-            )
-            response.raise_for_status()
-            data = await response.json()
+        response = await session.get(
+            RNLI_API_URL,
+            headers={"Accept": "application/json"},
+            params={"numberOfShouts": MAX_SHOUTS},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = json_loads(await response.read())
 
+        live_stations: dict[str, str] = {}
         for launch in data:
             short_name = launch.get("shortName")
-            if not short_name:
-                continue
-            key = normalize_station(short_name)
-            entry = self._stations.setdefault(key, {})
+            if short_name:
+                live_stations.setdefault(short_name, launch.get("title") or short_name)
+
+        cached = _StationCache(time.monotonic(), live_stations)
+        domain_data["_station_cache"] = cached
+        return cached
+
+    async def _async_overlay_live_stations(self) -> _StationCache:
+        """Overlay station names seen in the recent-launches feed."""
+        cached = await self._async_fetch_live_stations()
+        for short_name, title in cached.stations.items():
+            entry = self._stations.setdefault(normalize_station(short_name), {})
             entry["value"] = short_name
-            entry.setdefault("label", launch.get("title") or short_name)
+            entry.setdefault("label", title)
+        return cached
 
     def _station_options(self) -> list[SelectOptionDict]:
         """Build dropdown options, nearest to the home location first."""
@@ -95,6 +133,39 @@ class RNLIConfigFlow(ConfigFlow, domain=DOMAIN):
             options.append(SelectOptionDict(value=entry["value"], label=label))
         return options
 
+    async def _async_station_schema(self) -> vol.Schema:
+        """Return the station dropdown schema, building it only once."""
+        if self._schema is not None:
+            return self._schema
+
+        cached: _StationCache | None = None
+        try:
+            cached = await self._async_overlay_live_stations()
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+            # The bundled station list still populates the dropdown, so a
+            # feed hiccup here is not fatal to setup.
+            _LOGGER.warning("Could not fetch recent RNLI launches: %s", err)
+
+        if cached is not None and cached.schema is not None:
+            self._schema = cached.schema
+            return self._schema
+
+        self._schema = vol.Schema(
+            {
+                vol.Required(CONF_STATION): SelectSelector(
+                    SelectSelectorConfig(
+                        options=self._station_options(),
+                        mode=SelectSelectorMode.DROPDOWN,
+                        custom_value=True,
+                        sort=False,
+                    )
+                )
+            }
+        )
+        if cached is not None:
+            cached.schema = self._schema
+        return self._schema
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -114,25 +185,5 @@ class RNLIConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
             errors["base"] = "invalid_station"
 
-        try:
-            await self._async_overlay_live_stations()
-        except (aiohttp.ClientError, TimeoutError) as err:
-            # The bundled station list still populates the dropdown, so a
-            # feed hiccup here is not fatal to setup.
-            _LOGGER.warning("Could not fetch recent RNLI launches: %s", err)
-
-        options = self._station_options()
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_STATION): SelectSelector(
-                    SelectSelectorConfig(
-                        options=options,
-                        mode=SelectSelectorMode.DROPDOWN,
-                        custom_value=True,
-                        sort=False,
-                    )
-                )
-            }
-        )
-
+        schema = await self._async_station_schema()
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
@@ -1,6 +1,8 @@
 """Constants for the RNLI Launches integration."""
 from datetime import timedelta
 
+from aiohttp import ClientTimeout
+
 DOMAIN = "rnli_launches"
 RNLI_API_URL = "https://services.rnli.org/api/launches"
 
@@ -8,7 +10,11 @@ CONF_STATION = "station_short_name"
 
 ATTRIBUTION = "Data provided by the RNLI"
 SCAN_INTERVAL = timedelta(minutes=5)
-REQUEST_TIMEOUT = 10
+# Polling slows down towards this while the feed is not changing
+MAX_SCAN_INTERVAL = timedelta(minutes=30)
+REQUEST_TIMEOUT = ClientTimeout(total=10)
+# How long the config flow reuses the station names seen in the feed, in seconds
+STATION_CACHE_TTL = 600
 
 # The API caps numberOfShouts at 50
 MAX_SHOUTS = 50
@@ -1,20 +1,21 @@
 """Data update coordinator for the RNLI Launches integration."""
 from __future__ import annotations
 
-import asyncio
+from collections import defaultdict
+from http import HTTPStatus
 import logging
 from typing import Any
 
 import aiohttp
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
-    CONF_STATION,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     MAX_SHOUTS,
     REQUEST_TIMEOUT,
     RNLI_API_URL,
@@ -25,51 +26,89 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-class RNLIUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
-    """Fetch RNLI launch data and filter it for one station."""
+class RNLIUpdateCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, Any]]]]):
+    """Fetch the recent RNLI launches feed shared by all configured stations.
 
-    config_entry: ConfigEntry
+    The feed is downloaded once per interval however many stations are
+    configured, and grouped by normalized station name so each sensor can
+    look up its own launches directly.
+    """
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the coordinator."""
-        self.station = entry.data[CONF_STATION]
         self.session = async_get_clientsession(hass)
+        self.headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        # Validators from the last full response, sent back so an unchanged
+        # feed comes back as an empty 304 instead of the whole list
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        # launchDate of the newest launch in the feed at the last poll
+        self._newest_launch_date: str | None = None
 
         super().__init__(
             hass,
             _LOGGER,
-            config_entry=entry,
-            name=f"{DOMAIN}_{self.station}",
+            config_entry=None,
+            name=DOMAIN,
             update_interval=SCAN_INTERVAL,
         )
 
-    async def _async_update_data(self) -> list[dict[str, Any]]:
-        """Fetch the latest launches for the configured station."""
+    async def _async_update_data(self) -> dict[str, list[dict[str, Any]]]:
+        """Fetch the latest launches across all stations."""
+        headers = dict(self.headers)
+        if self.data is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
         try:
-            async with asyncio.timeout(REQUEST_TIMEOUT):
-                response = await self.session.get(
-                    RNLI_API_URL,
-                    headers={"Accept": "application/json"},
-                    params={"numberOfShouts": MAX_SHOUTS},
-                )
-                response.raise_for_status()
-                data = await response.json()
-        except (aiohttp.ClientError, TimeoutError) as err:
+            response = await self.session.get(
+                RNLI_API_URL,
+                headers=headers,
+                params={"numberOfShouts": MAX_SHOUTS},
+                timeout=REQUEST_TIMEOUT,
+            )
+            if response.status == HTTPStatus.NOT_MODIFIED and self.data is not None:
+                _LOGGER.debug("RNLI launches feed not modified")
+                self._adjust_update_interval(self._newest_launch_date)
+                return self.data
+            response.raise_for_status()
+            data = json_loads(await response.read())
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
             raise UpdateFailed(f"Error fetching data from RNLI API: {err}") from err
 
         if not isinstance(data, list):
             raise UpdateFailed("Unexpected response from RNLI API")
 
-        station_key = normalize_station(self.station)
-        station_launches = [
-            launch
-            for launch in data
-            if normalize_station(launch.get("shortName") or "") == station_key
-        ]
-        # ISO 8601 date strings sort correctly as plain strings
-        station_launches.sort(key=lambda x: x.get("launchDate") or "", reverse=True)
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+
+        launches_by_station: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        newest = ""
+        for launch in data:
+            if short_name := launch.get("shortName"):
+                launches_by_station[normalize_station(short_name)].append(launch)
+            # ISO 8601 date strings compare correctly as plain strings
+            newest = max(newest, launch.get("launchDate") or "")
+        self._adjust_update_interval(newest)
 
         _LOGGER.debug(
-            "Found %d launches for %s", len(station_launches), self.station
+            "Fetched %d recent launches from %d stations",
+            len(data),
+            len(launches_by_station),
         )
-        return station_launches
+        return dict(launches_by_station)
+
+    def _adjust_update_interval(self, newest_launch_date: str | None) -> None:
+        """Poll less often while the feed is quiet, and reset once it moves.
+
+        Most stations launch only a few times a week, so a feed that has not
+        gained a new launch backs off towards MAX_SCAN_INTERVAL.
+        """
+        if newest_launch_date != self._newest_launch_date:
+            self._newest_launch_date = newest_launch_date
+            self.update_interval = SCAN_INTERVAL
+        elif self.update_interval is not None:
+            self.update_interval = min(MAX_SCAN_INTERVAL, self.update_interval * 1.5)
+        _LOGGER.debug("Next RNLI launches poll in %s", self.update_interval)
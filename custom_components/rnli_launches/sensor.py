@@ -4,6 +4,8 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -15,7 +17,7 @@ from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import RNLIConfigEntry
-from .const import ATTRIBUTION, DOMAIN, normalize_station
+from .const import ATTRIBUTION, CONF_STATION, DOMAIN, normalize_station
 from .coordinator import RNLIUpdateCoordinator
 from .stations import STATIONS
 
@@ -24,19 +26,30 @@ _LOGGER = logging.getLogger(__name__)
 # The RNLI feed reports launch times in UK local time without a UTC offset
 RNLI_TIMEZONE = ZoneInfo("Europe/London")
 
+# Launch fields already exposed under their own attribute names, or as the state
+_EXCLUDED_LAUNCH_KEYS = frozenset(
+    {"id", "lifeboat_IdNo", "title", "website", "shortName", "launchDate"}
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_launch_date(launch_date: str) -> datetime:
+    """Parse a launchDate string, cached as the same launches recur each poll."""
+    launch_time = datetime.fromisoformat(launch_date)
+    if launch_time.tzinfo is None:
+        launch_time = launch_time.replace(tzinfo=RNLI_TIMEZONE)
+    return launch_time
+
 
 def _launch_datetime(launch: dict[str, Any] | None) -> datetime | None:
     """Parse a launch's timestamp into a timezone-aware datetime."""
     if not launch or not launch.get("launchDate"):
         return None
     try:
-        launch_time = datetime.fromisoformat(launch["launchDate"])
+        return _parse_launch_date(launch["launchDate"])
     except (ValueError, TypeError):
         _LOGGER.warning("Could not parse launchDate: %s", launch.get("launchDate"))
         return None
-    if launch_time.tzinfo is None:
-        launch_time = launch_time.replace(tzinfo=RNLI_TIMEZONE)
-    return launch_time
 
 
 def _launch_from_state(state: State) -> dict[str, Any] | None:
@@ -74,7 +87,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the RNLI Launch sensor from a config entry."""
-    async_add_entities([RNLILaunchSensor(entry.runtime_data)])
+    slug = hass.data[DOMAIN]["entries"][entry.entry_id]
+    async_add_entities(
+        [RNLILaunchSensor(entry.runtime_data, entry.data[CONF_STATION], slug)]
+    )
 
 
 class RNLILaunchSensor(
@@ -86,27 +102,29 @@ class RNLILaunchSensor(
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:sail-boat"
 
-    def __init__(self, coordinator: RNLIUpdateCoordinator) -> None:
+    def __init__(
+        self, coordinator: RNLIUpdateCoordinator, station: str, slug: str
+    ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self._station = station
+        self._station_key = normalize_station(station)
+        # This station's launches in the current feed window.
+        self._station_launches: list[dict[str, Any]] = []
         # The last launch we have ever seen for this station. It only ever
         # advances to a newer launch, and is restored on restart, so it
         # survives the station scrolling out of the API's recent window.
         self._last_launch: dict[str, Any] | None = None
-        station = coordinator.station
-        station_key = normalize_station(station)
         self._station_info = next(
             (
                 info
                 for name, info in STATIONS.items()
-                if normalize_station(name) == station_key
+                if normalize_station(name) == self._station_key
             ),
             None,
         )
         self._attr_name = f"RNLI {station} Latest Launch"
-        self._attr_unique_id = (
-            f"{DOMAIN}_{station.lower().replace(' ', '_')}_latest_launch"
-        )
+        self._attr_unique_id = f"{DOMAIN}_{slug}_latest_launch"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, station.lower())},
             name=f"RNLI {station}",
@@ -117,6 +135,17 @@ class RNLILaunchSensor(
             ),
         )
 
+        # Attributes that do not change between updates
+        self._base_attrs: dict[str, Any] = {"station_monitored": station}
+        if self._station_info:
+            # latitude/longitude place the sensor on the Home Assistant map
+            self._base_attrs["latitude"] = self._station_info["latitude"]
+            self._base_attrs["longitude"] = self._station_info["longitude"]
+            self._base_attrs["station_url"] = self._station_info["url"]
+            self._base_attrs["what3words"] = self._station_info["what3words"]
+            self._base_attrs["station_type"] = self._station_info["station_type"]
+        self._update_state()
+
     @property
     def extra_restore_state_data(self) -> RNLIRestoreData:
         """Persist the last known launch so it survives a restart."""
@@ -135,12 +164,26 @@ class RNLILaunchSensor(
 
         # The first refresh may already carry a newer launch than we restored.
         self._update_last_launch()
+        self._update_state()
         self.async_write_ha_state()
 
+    @callback
+    def _update_station_launches(self) -> None:
+        """Pick this station's launches out of the shared feed."""
+        self._station_launches = (self.coordinator.data or {}).get(
+            self._station_key, []
+        )
+
     @callback
     def _update_last_launch(self) -> bool:
         """Advance to the newest launch in the feed, if it is newer."""
-        newest = self.coordinator.data[0] if self.coordinator.data else None
+        self._update_station_launches()
+        # ISO 8601 date strings compare correctly as plain strings
+        newest = max(
+            self._station_launches,
+            key=lambda x: x.get("launchDate") or "",
+            default=None,
+        )
         if newest is None:
             return False
         new_dt = _launch_datetime(newest)
@@ -154,35 +197,25 @@ class RNLILaunchSensor(
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_last_launch()
+        self._update_state()
         self.async_write_ha_state()
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the timestamp of the last known launch."""
-        return _launch_datetime(self._last_launch)
+    @callback
+    def _update_state(self) -> None:
+        """Build the state and attributes once per update, not per read."""
+        self._attr_native_value = _launch_datetime(self._last_launch)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        attributes: dict[str, Any] = {
-            "station_monitored": self.coordinator.station,
+        attributes = self._base_attrs | {
             # How many launches for this station are in the current feed window
-            "recent_launch_count": len(self.coordinator.data),
+            "recent_launch_count": len(self._station_launches),
         }
-        if self._station_info:
-            # latitude/longitude place the sensor on the Home Assistant map
-            attributes["latitude"] = self._station_info["latitude"]
-            attributes["longitude"] = self._station_info["longitude"]
-            attributes["station_url"] = self._station_info["url"]
-            attributes["what3words"] = self._station_info["what3words"]
-            attributes["station_type"] = self._station_info["station_type"]
-
         launch = self._last_launch
         if launch is None:
             attributes["last_launch_info"] = (
                 "No launches seen yet for this station."
             )
-            return attributes
+            self._attr_extra_state_attributes = MappingProxyType(attributes)
+            return
 
         attributes["launch_id"] = launch.get("id")
         attributes["lifeboat_id"] = launch.get("lifeboat_IdNo")
@@ -190,13 +223,6 @@ class RNLILaunchSensor(
         attributes["station_website"] = launch.get("website")
         # Include any other fields the API provides for the latest launch
         for key, value in launch.items():
-            if key not in (
-                "id",
-                "lifeboat_IdNo",
-                "title",
-                "website",
-                "shortName",
-                "launchDate",
-            ):
+            if key not in _EXCLUDED_LAUNCH_KEYS:
                 attributes[key] = value
-        return attributes
+        self._attr_extra_state_attributes = MappingProxyType(attributes)
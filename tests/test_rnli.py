@@ -1,5 +1,5 @@
 """End-to-end test: config flow GUI -> entry -> sensor entity."""
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from homeassistant.core import HomeAssistant, State
@@ -292,3 +292,113 @@ async def test_last_launch_kept_when_station_drops_out_of_feed(
     )
     assert state.attributes["lifeboat_id"] == "13-55"
     assert state.attributes["recent_launch_count"] == 0
+
+
+async def test_stations_share_one_feed_fetch(
+    hass: HomeAssistant, aioclient_mock
+) -> None:
+    """Every configured station is served from a single download of the feed."""
+    aioclient_mock.get(API_URL, json=LAUNCHES)
+
+    troon = _troon_entry()
+    st_ives = MockConfigEntry(
+        domain="rnli_launches",
+        data={"station_short_name": "St Ives"},
+        unique_id="st ives",
+        title="RNLI St Ives",
+    )
+    troon.add_to_hass(hass)
+    st_ives.add_to_hass(hass)
+    await hass.config_entries.async_setup(troon.entry_id)
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert troon.runtime_data is st_ives.runtime_data
+    assert (
+        hass.states.get("sensor.rnli_troon_latest_launch").attributes["lifeboat_id"]
+        == "13-55"
+    )
+    assert (
+        hass.states.get("sensor.rnli_st_ives_latest_launch").attributes[
+            "lifeboat_id"
+        ]
+        == "D-803"
+    )
+
+    assert await hass.config_entries.async_unload(troon.entry_id)
+    assert "coordinator" in hass.data["rnli_launches"]
+    assert await hass.config_entries.async_unload(st_ives.entry_id)
+    assert "coordinator" not in hass.data["rnli_launches"]
+
+
+async def test_station_list_cached_between_flows(
+    hass: HomeAssistant, aioclient_mock
+) -> None:
+    """Starting the flow again shortly after reuses the fetched station names."""
+    aioclient_mock.get(API_URL, json=LAUNCHES)
+
+    schemas = []
+    for _ in range(2):
+        result = await hass.config_entries.flow.async_init(
+            "rnli_launches", context={"source": "user"}
+        )
+        assert result["type"] == "form", result
+        schemas.append(result["data_schema"])
+
+    assert aioclient_mock.call_count == 1
+    # the dropdown built by the first flow is reused as well
+    assert schemas[0] is schemas[1]
+
+
+async def test_unchanged_feed_keeps_data_on_304(
+    hass: HomeAssistant, aioclient_mock
+) -> None:
+    """A conditional refresh answered with 304 keeps the previous feed."""
+    aioclient_mock.get(API_URL, json=LAUNCHES, headers={"ETag": '"feed-1"'})
+
+    entry = _troon_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(API_URL, status=304)
+    await entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.last_update_success
+    _, _, _, headers = aioclient_mock.mock_calls[0]
+    assert headers["If-None-Match"] == '"feed-1"'
+    state = hass.states.get("sensor.rnli_troon_latest_launch")
+    assert state.attributes["lifeboat_id"] == "13-55"
+    assert state.attributes["recent_launch_count"] == 2
+
+
+async def test_polling_backs_off_while_feed_is_quiet(
+    hass: HomeAssistant, aioclient_mock
+) -> None:
+    """Unchanged feeds slow polling down; a new launch restores the default."""
+    aioclient_mock.get(API_URL, json=LAUNCHES)
+
+    entry = _troon_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    assert coordinator.update_interval == timedelta(minutes=5)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=7, seconds=30)
+
+    for _ in range(10):
+        await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=30)
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        API_URL,
+        json=[{**OLD_TROON_LAUNCH, "launchDate": "2026-07-15T08:00:00"}, *LAUNCHES],
+    )
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=5)